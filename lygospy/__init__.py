@@ -2,5 +2,16 @@
 
 __version__ = "0.1.0"
 
-from .lygospy import Lygos
-from .error_handler import LygosAPIError, AuthenticationError
\ No newline at end of file
+from .error_handler import LygosAPIError, AuthenticationError
+
+__all__ = ["Lygos", "LygosAPIError", "AuthenticationError"]
+
+
+def __getattr__(name):
+    # PEP 562: only import the HTTP client (and with it requests/urllib3)
+    # when Lygos is actually accessed, so importing the package just for
+    # the exceptions stays cheap.
+    if name == "Lygos":
+        from .lygospy import Lygos
+        return Lygos
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,11 +5,45 @@ Ce module fournit une classe `Lygos` pour interagir avec l'API Lygos,
 gérant l'authentification, la création de requêtes et la gestion des erreurs.
 """
 
+import asyncio
 import requests
-import uuid
-from requests.exceptions import HTTPError, RequestException
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import urandom
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
 from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+from urllib3.util.retry import Retry
+
+# Prefer orjson for JSON encode/decode (2-5x faster than stdlib and
+# produces bytes directly); fall back to the stdlib when unavailable.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+# Optional dependency for the HTTP/2 multiplexed batch path
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional dependency for incremental JSON parsing of large listings
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Import custom exceptions from the local module
 from .error_handler import (
@@ -32,6 +66,21 @@ DEFAULT_API_URL = "https://api.lygosapp.com/v1/"
 # Type alias for JSON responses
 JsonDict = Dict[str, Any]
 
+# Map HTTP status codes to exception classes. Module-level so the hot
+# path in _request skips the attribute lookup.
+_ERROR_MAP = {
+    400: BadRequestError,
+    401: AuthenticationError,
+    403: PermissionDeniedError,
+    404: NotFoundError,
+    409: ConflictError,
+    422: UnprocessableEntityError,
+    500: ServerError,
+    502: BadGatewayError,
+    503: ServiceUnavailableError,
+    504: GatewayTimeoutError,
+}
+
 
 class Lygos:
     """
@@ -59,29 +108,29 @@ class Lygos:
         api_key (str): Votre clé API Lygos.
         base_url (str): L'URL de base de l'API Lygos.
         session (requests.Session): Session pour la persistance des connexions.
+        headers (Mapping[str, str]): En-têtes de référence du client,
+            exposés en lecture seule.
     """
 
-    # Use a set for O(1) existence checks
+    # Slots keep instances to a fixed set of attributes (no per-instance
+    # __dict__), which shrinks memory and speeds attribute access
+    __slots__ = (
+        "api_key", "base_url", "session", "headers", "_base", "_pool_size",
+        "_server_supports_batch", "_http2", "_cache_ttl", "_cache_max",
+        "_gateway_cache", "_cache_lock", "_inflight", "_inflight_lock",
+    )
+
+    # Fields for which a get_<field> method is generated (see the loop
+    # after the class body)
     _SUPPORTED_GET_FIELDS = {
         "link", "amount", "shop_name", "message", "user_country",
         "creation_date", "order_id", "success_url", "failure_url"
     }
 
-    # Map HTTP status codes to exception classes
-    _ERROR_MAP = {
-        400: BadRequestError,
-        401: AuthenticationError,
-        403: PermissionDeniedError,
-        404: NotFoundError,
-        409: ConflictError,
-        422: UnprocessableEntityError,
-        500: ServerError,
-        502: BadGatewayError,
-        503: ServiceUnavailableError,
-        504: GatewayTimeoutError,
-    }
-
-    def __init__(self, api_key: str, api_url: str = DEFAULT_API_URL):
+    def __init__(self, api_key: str, api_url: str = DEFAULT_API_URL,
+                 pool_size: int = 32, server_supports_batch: bool = False,
+                 cache_ttl: float = 60.0, cache_max: int = 1024,
+                 http2: bool = False, retries: Optional[Retry] = None):
         """
         Initialise le client Lygos.
 
@@ -89,79 +138,129 @@ class Lygos:
             api_key (str): Votre clé API Lygos. Ne doit pas être vide.
             api_url (str, optional): L'URL de base de l'API.
                                     Par défaut à `DEFAULT_API_URL`.
-        
+            pool_size (int, optional): Taille du pool de connexions et nombre
+                                       maximum de requêtes concurrentes pour
+                                       les méthodes `*_batch`. Par défaut 32.
+            server_supports_batch (bool, optional): Si True, les méthodes
+                `*_batch` regroupent leurs opérations en un seul appel POST
+                vers l'endpoint `batch` au lieu d'un appel HTTP par élément.
+                Par défaut False.
+            cache_ttl (float, optional): Durée de vie (en secondes) du cache
+                local de `get_gateway`. 0 désactive le cache. Par défaut 60.
+            cache_max (int, optional): Nombre maximum d'entrées du cache
+                avant éviction LRU. Par défaut 1024.
+            http2 (bool, optional): Si True, les méthodes `*_batch`
+                multiplexent leurs requêtes sur une seule connexion HTTP/2
+                via `httpx` (dépendance optionnelle, extra "http2").
+                Par défaut False.
+            retries (urllib3.util.retry.Retry, optional): Politique de
+                réessai appliquée par le pool de connexions. Par défaut,
+                5 tentatives avec backoff exponentiel sur 429/502/503/504,
+                en respectant l'en-tête Retry-After.
+
         Raises:
             ValueError: Si l'api_key est vide.
+            ImportError: Si http2=True mais que `httpx` n'est pas installé.
         """
         if not api_key:
             raise ValueError("Une 'api_key' est requise pour initialiser le client.")
-            
+        if http2 and httpx is None:
+            raise ImportError("http2=True nécessite le paquet 'httpx' "
+                              "(pip install lygospy[http2]).")
+
         self.api_key = api_key
         self.base_url = api_url
-        
-        # Initialize a session for performance (connection pooling)
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Precomputed base so _request avoids re-parsing URLs with urljoin
+        # on every call; all endpoints in this class are relative paths.
+        self._base = api_url if api_url.endswith("/") else api_url + "/"
+        self._pool_size = pool_size
+        self._server_supports_batch = server_supports_batch
+        self._http2 = http2
+
+        # Small LRU+TTL cache for get_gateway, shared with the dynamic
+        # get_<field> getters. Guarded by a lock for the threaded batches.
+        self._cache_ttl = cache_ttl
+        self._cache_max = cache_max
+        self._gateway_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # In-flight GETs keyed by gateway_id, so concurrent callers asking
+        # for the same gateway share a single HTTP request
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Fixed headers sent with every request. Frozen via a read-only
+        # proxy: the session copy is the only mutable view, so sharing a
+        # client between threads (or test fixtures) cannot silently
+        # corrupt the reference headers.
+        self.headers = MappingProxyType({
             "api-key": self.api_key,
             "Content-Type": "application/json",
             "Accept": "application/json",
             "User-Agent": "Lygos-Python-Client-v1"
         })
 
+        # Initialize a session for performance (connection pooling)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
+        # Size the urllib3 pool so concurrent batch requests don't
+        # serialize on a single connection. Retries on transient statuses
+        # happen inside urllib3 (reusing the pooled connection) rather
+        # than in Python-level retry loops.
+        if retries is None:
+            retries = Retry(
+                total=5,
+                backoff_factor=0.25,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+                respect_retry_after_header=True,
+                # Once the retries are exhausted, hand back the final error
+                # response instead of raising MaxRetryError, so that
+                # _raise_api_error can map the status to the documented
+                # exception (BadGatewayError, ServiceUnavailableError, ...)
+                raise_on_status=False,
+            )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retries
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def __repr__(self) -> str:
         """Représentation officielle de l'objet pour le débogage."""
         return f"<{type(self).__name__}(api_url='{self.base_url}')>"
 
-    def __getattr__(self, name: str) -> Any:
+    def _request(self, method: str, endpoint: str, **kwargs: Any) -> Optional[Union[JsonDict, List[JsonDict]]]:
         """
-        Gère dynamiquement les appels de méthode `get_<field>(gateway_id)`.
-
-        Ceci permet des appels comme `lygos.get_link(gw_id)` sans avoir à
-        définir explicitement chaque méthode.
+        Effectue une requête HTTP vers un point de terminaison relatif.
 
         Args:
-            name (str): Le nom de l'attribut (méthode) demandé.
+            method (str): Méthode HTTP (GET, POST, PUT, DELETE).
+            endpoint (str): Le point de terminaison de l'API (ex: 'gateway').
+            **kwargs: Arguments supplémentaires à passer à `requests.request`
+                      (ex: json, params).
 
         Returns:
-            function: Une fonction getter si le champ est supporté.
-
-        Raises:
-            AttributeError: Si le nom ne correspond pas à un attribut
-                              existant ou à un getter dynamique supporté.
+            Optional[Union[JsonDict, List[JsonDict]]]:
+                La réponse JSON de l'API, ou None si 204 No Content.
         """
-        if name.startswith("get_") and name[4:] in self._SUPPORTED_GET_FIELDS:
-            field = name[4:]
-
-            def getter(gateway_id: str) -> JsonDict:
-                """
-                Getter généré dynamiquement pour un champ spécifique de la passerelle.
-
-                Args:
-                    gateway_id (str): L'ID de la passerelle à interroger.
-
-                Returns:
-                    JsonDict: Un dictionnaire contenant {field: value}.
-                """
-                gateway_data = self.get_gateway(gateway_id=gateway_id)
-                return {field: gateway_data.get(field)}
-            
-            # Assign a more descriptive name to the dynamic function
-            # for better debugging.
-            getter.__name__ = name
-            return getter
-
-        # Raise the standard error if the attribute is not found
-        raise AttributeError(
-            f"'{type(self).__name__}' object has no attribute '{name}'"
-        )
+        # All endpoints are relative paths, so plain concatenation on the
+        # precomputed base is enough (and cheaper than urljoin)
+        return self._dispatch(method, self._base + endpoint, **kwargs)
 
-    def _request(self, method: str, endpoint: str, **kwargs: Any) -> Optional[Union[JsonDict, List[JsonDict]]]:
+    def _dispatch(self, method: str, url: str, **kwargs: Any) -> Optional[Union[JsonDict, List[JsonDict]]]:
         """
         Méthode centrale pour effectuer des requêtes HTTP à l'API.
 
+        Prend une URL absolue, ce qui permet aux boucles batch de
+        préconstruire leurs URLs une seule fois.
+
         Args:
             method (str): Méthode HTTP (GET, POST, PUT, DELETE).
-            endpoint (str): Le point de terminaison de l'API (ex: 'gateway').
+            url (str): L'URL absolue à appeler.
             **kwargs: Arguments supplémentaires à passer à `requests.request`
                       (ex: json, params).
 
@@ -174,42 +273,186 @@ class Lygos:
             (Specific Errors): Erreurs spécifiques (ex: NotFoundError)
                                  basées sur le code de statut HTTP.
         """
-        # Build the URL robustly
-        url = urljoin(self.base_url, endpoint)
-        
+        # Serialize bodies ourselves so orjson is used instead of the
+        # stdlib encoder inside requests (Content-Type is already set on
+        # the session headers)
+        if "json" in kwargs:
+            kwargs["data"] = _dumps(kwargs.pop("json"))
+
         try:
             response = self.session.request(method, url, **kwargs)
-            # Raise an exception for HTTP error codes (4xx, 5xx)
-            response.raise_for_status()
+        except RequestException as err:
+            # For network issues, timeouts, DNS, etc.
+            raise LygosAPIError(f"Erreur de connexion à l'API: {err}") from err
 
+        # Branch on the status code directly: no exception construction on
+        # the happy path (raise_for_status would re-check and raise/catch)
+        status_code = response.status_code
+        if status_code < 400:
             # Handle the "204 No Content" case
-            if response.status_code == 204:
+            if status_code == 204:
                 return None
-            
-            # Return the JSON if it exists
-            return response.json()
+            # Decode the body directly from bytes, skipping the str
+            # round-trip response.json() would do
+            return _loads(response.content)
 
-        except HTTPError as err:
-            status_code = err.response.status_code
-            try:
-                # Try to extract the error message from the JSON body
-                error_data = err.response.json()
-                error_message = error_data.get("message", err.response.reason)
-                details = error_data.get("details")
-                if details:
-                    error_message = f"{error_message}: {details}"
-            except requests.JSONDecodeError:
-                # If the body is not JSON, use the raw text or reason
-                error_message = err.response.text or err.response.reason
-
-            # Raise the appropriate custom exception
-            exception_class = self._ERROR_MAP.get(status_code, LygosAPIError)
-            raise exception_class(error_message, status_code) from err
-        
+        self._raise_api_error(response)
+
+    def _conditional_get(self, url: str, etag: Optional[str]) -> tuple:
+        """
+        Effectue un GET conditionnel (If-None-Match) sur une URL absolue.
+
+        Args:
+            url (str): L'URL absolue à appeler.
+            etag (Optional[str]): L'ETag de la copie locale, ou None pour
+                un GET ordinaire.
+
+        Returns:
+            tuple: (valeur, etag) — la valeur vaut None si le serveur a
+                répondu 304 Not Modified (la copie locale est à jour).
+        """
+        try:
+            if etag:
+                response = self.session.request(
+                    "GET", url, headers={"If-None-Match": etag})
+            else:
+                response = self.session.request("GET", url)
         except RequestException as err:
-            # For network issues, timeouts, DNS, etc.
             raise LygosAPIError(f"Erreur de connexion à l'API: {err}") from err
 
+        status_code = response.status_code
+        if status_code == 304:
+            # Not Modified: headers only, no body to parse
+            return None, etag
+        if status_code >= 400:
+            self._raise_api_error(response)
+        return _loads(response.content), response.headers.get("ETag")
+
+    @staticmethod
+    def _raise_api_error(response: requests.Response) -> None:
+        """
+        Relève l'exception correspondant à une réponse d'erreur HTTP.
+
+        Args:
+            response (requests.Response): La réponse 4xx/5xx reçue.
+
+        Raises:
+            LygosAPIError: L'exception mappée sur le code de statut.
+        """
+        status_code = response.status_code
+        try:
+            # Try to extract the error message from the JSON body
+            error_data = _loads(response.content)
+            error_message = error_data.get("message", response.reason)
+            details = error_data.get("details")
+            if details:
+                error_message = f"{error_message}: {details}"
+        except ValueError:
+            # If the body is not JSON, use the raw text or reason
+            error_message = response.text or response.reason
+
+        # Raise the appropriate custom exception
+        exception_class = _ERROR_MAP.get(status_code, LygosAPIError)
+        raise exception_class(error_message, status_code)
+
+    def _batch_request(self, ops: List[JsonDict]) -> List[Any]:
+        """
+        Envoie plusieurs opérations en un seul appel POST vers `batch`.
+
+        Args:
+            ops (List[JsonDict]): Les opérations à exécuter, chacune de la
+                forme {"method": ..., "path": ..., "body": ...}.
+
+        Returns:
+            List[Any]: Un résultat par opération, dans l'ordre d'entrée.
+                Une entrée en échec est représentée par l'instance
+                d'exception correspondant à son code de statut.
+        """
+        envelope = self._request("POST", "batch", json={"requests": ops})
+        results: List[Any] = []
+        for entry in envelope.get("responses", []):
+            status = entry.get("status", 200)
+            if status < 400:
+                results.append(None if status == 204 else entry.get("body"))
+            else:
+                body = entry.get("body") or {}
+                message = body.get("message", f"HTTP {status}")
+                exception_class = _ERROR_MAP.get(status, LygosAPIError)
+                results.append(exception_class(message, status))
+        return results
+
+    def _batch_http2(self, ops: List[JsonDict]) -> List[Any]:
+        """
+        Exécute plusieurs opérations multiplexées sur une connexion HTTP/2.
+
+        Toutes les requêtes partagent une unique connexion TCP+TLS via
+        `httpx.AsyncClient(http2=True)`, au lieu d'ouvrir un socket par
+        requête concurrente comme le fait le pool urllib3.
+
+        Args:
+            ops (List[JsonDict]): Les opérations à exécuter, chacune de la
+                forme {"method": ..., "path": ..., "body": ...}.
+
+        Returns:
+            List[Any]: Un résultat par opération, dans l'ordre d'entrée.
+                Une entrée en échec est représentée par l'instance
+                d'exception correspondant à son code de statut.
+        """
+        async def run_all() -> List[Any]:
+            limits = httpx.Limits(max_connections=1,
+                                  max_keepalive_connections=1)
+            async with httpx.AsyncClient(base_url=self._base, http2=True,
+                                         headers=dict(self.session.headers),
+                                         limits=limits) as client:
+                async def run_one(op: JsonDict) -> Any:
+                    content = _dumps(op["body"]) if "body" in op else None
+                    try:
+                        response = await client.request(
+                            op["method"], op["path"], content=content)
+                    except httpx.HTTPError as err:
+                        return LygosAPIError(
+                            f"Erreur de connexion à l'API: {err}")
+                    status = response.status_code
+                    if status < 400:
+                        return None if status == 204 else _loads(response.content)
+                    try:
+                        body = _loads(response.content)
+                        message = body.get("message", response.reason_phrase)
+                    except ValueError:
+                        message = response.text or response.reason_phrase
+                    return _ERROR_MAP.get(status, LygosAPIError)(message, status)
+
+                return list(await asyncio.gather(*(run_one(op) for op in ops)))
+
+        return asyncio.run(run_all())
+
+    def _batch_dispatch(self, ops: List[JsonDict]) -> Optional[List[Any]]:
+        """
+        Route un lot d'opérations vers l'endpoint batch ou HTTP/2.
+
+        Returns:
+            Optional[List[Any]]: Les résultats par opération (liste vide
+                pour un lot vide, sans aucun appel HTTP), ou None si
+                aucun des deux transports groupés n'est activé (les méthodes
+                `*_batch` retombent alors sur le fan-out threadé).
+        """
+        # A batch with nothing in it must stay free on every transport
+        if not ops:
+            return []
+        if self._server_supports_batch:
+            return self._batch_request(ops)
+        if self._http2:
+            return self._batch_http2(ops)
+        return None
+
+    @staticmethod
+    def _raise_batch_errors(results: List[Any]) -> List[Any]:
+        """Relève la première exception d'une liste de résultats batch."""
+        for result in results:
+            if isinstance(result, LygosAPIError):
+                raise result
+        return results
+
     # --- Gateway API Methods ---
 
     def list_gateways(self) -> List[JsonDict]:
@@ -222,6 +465,36 @@ class Lygos:
         """
         return self._request("GET", "gateway")
 
+    def iter_gateways(self):
+        """
+        Itère sur les passerelles sans matérialiser toute la liste.
+
+        La réponse est lue en streaming et, si `ijson` est installé
+        (extra "stream"), parsée incrémentalement : la mémoire reste en
+        O(1) par élément et les premiers résultats sont disponibles avant
+        la fin du transfert. Sans `ijson`, le corps complet est parsé puis
+        itéré.
+
+        Yields:
+            JsonDict: Les données d'une passerelle.
+        """
+        try:
+            response = self.session.get(self._base + "gateway", stream=True)
+        except RequestException as err:
+            raise LygosAPIError(f"Erreur de connexion à l'API: {err}") from err
+
+        with response:
+            if response.status_code >= 400:
+                self._raise_api_error(response)
+            if ijson is not None:
+                # requests leaves the urllib3 stream undecoded by default;
+                # without this, a gzip/deflate response would hand ijson
+                # compressed bytes (response.content decodes on its own)
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, "item")
+            else:
+                yield from _loads(response.content)
+
     def create_gateway(self, amount: int, shop_name: str, order_id: Optional[str] = None,
                        message: Optional[str] = None, success_url: Optional[str] = None,
                        failure_url: Optional[str] = None) -> JsonDict:
@@ -231,8 +504,9 @@ class Lygos:
         Args:
             amount (int): Le montant de la transaction.
             shop_name (str): Le nom du magasin.
-            order_id (str, optional): ID de commande unique. Si None, un UUID4
-                                      est généré.
+            order_id (str, optional): ID de commande unique. Si None, un
+                                      identifiant aléatoire de 32 caractères
+                                      hexadécimaux est généré.
             message (str, optional): Message à afficher au client.
             success_url (str, optional): URL de redirection en cas de succès.
             failure_url (str, optional): URL de redirection en cas d'échec.
@@ -243,7 +517,7 @@ class Lygos:
         data: JsonDict = {
             "amount": amount,
             "shop_name": shop_name,
-            "order_id": order_id or str(uuid.uuid4())
+            "order_id": order_id or urandom(16).hex()
         }
         # Add optional fields only if they are not None
         if message is not None:
@@ -257,53 +531,138 @@ class Lygos:
 
     def create_gateways_batch(self, gateways_data: List[JsonDict]) -> List[JsonDict]:
         """
-        Crée plusieurs passerelles de paiement (via des appels POST successifs).
+        Crée plusieurs passerelles de paiement (via des appels POST concurrents).
 
         Args:
             gateways_data (List[JsonDict]): Une liste de dictionnaires,
                 chacun contenant les données d'une passerelle à créer.
-                'order_id' sera auto-généré si non fourni.
+                'order_id' sera auto-généré si non fourni (32 caractères
+                hexadécimaux aléatoires).
 
         Returns:
-            List[JsonDict]: Une liste des passerelles créées.
+            List[JsonDict]: Une liste des passerelles créées, dans l'ordre
+                            d'entrée.
         """
-        created_gateways = []
+        # Assign order_ids upfront so each task is independent
         for gateway_data in gateways_data:
-            # Ensure an order_id for each, without overwriting an existing one
-            gateway_data.setdefault("order_id", str(uuid.uuid4()))
+            gateway_data.setdefault("order_id", urandom(16).hex())
+
+        ops = [{"method": "POST", "path": "gateway", "body": gateway_data}
+               for gateway_data in gateways_data]
+        results = self._batch_dispatch(ops)
+        if results is not None:
+            return [
+                {"error": str(result), "data": gateway_data}
+                if isinstance(result, LygosAPIError) else result
+                for result, gateway_data in zip(results, gateways_data)
+            ]
+
+        # The URL is identical for every item, build it once. Bodies are
+        # serialized here rather than in the workers, so the threads only
+        # block on I/O (which releases the GIL) instead of encoding JSON.
+        url = self._base + "gateway"
+        payloads = [(gateway_data, _dumps(gateway_data))
+                    for gateway_data in gateways_data]
+
+        def create_one(item: tuple) -> JsonDict:
+            gateway_data, body = item
             try:
-                created = self._request("POST", "gateway", json=gateway_data)
-                created_gateways.append(created)
+                return self._dispatch("POST", url, data=body)
             except LygosAPIError as e:
                 # Handle or log the error for a single batch failure
                 print(f"Échec de la création de la passerelle (order_id: {gateway_data.get('order_id')}): {e}")
-                created_gateways.append({"error": str(e), "data": gateway_data})
-                
-        return created_gateways
+                return {"error": str(e), "data": gateway_data}
+
+        with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
+            return list(executor.map(create_one, payloads))
 
     def get_gateway(self, gateway_id: str) -> JsonDict:
         """
         Récupère une passerelle de paiement spécifique par son ID.
 
+        Le résultat est mis en cache localement pendant `cache_ttl` secondes,
+        de sorte que des lectures répétées (notamment via les getters
+        dynamiques `get_<field>`) ne refassent pas d'appel HTTP. Une entrée
+        expirée est revalidée par GET conditionnel (If-None-Match) quand le
+        serveur a fourni un ETag : sur 304, seule l'horodatage est rafraîchi.
+
         Args:
             gateway_id (str): L'ID de la passerelle (ex: "gw_...").
 
         Returns:
             JsonDict: Les données de la passerelle.
         """
-        return self._request("GET", f"gateway/{gateway_id}")
+        stale_etag = None
+        stale_value = None
+        if self._cache_ttl > 0:
+            with self._cache_lock:
+                entry = self._gateway_cache.get(gateway_id)
+                if entry is not None:
+                    timestamp, etag, value = entry
+                    if time.monotonic() - timestamp < self._cache_ttl:
+                        self._gateway_cache.move_to_end(gateway_id)
+                        return value
+                    # Keep the stale copy around: with its ETag we can
+                    # revalidate instead of re-downloading the body
+                    stale_etag, stale_value = etag, value
+                    del self._gateway_cache[gateway_id]
+
+        # Coalesce concurrent misses: only one thread performs the GET,
+        # the others wait on its future.
+        with self._inflight_lock:
+            future = self._inflight.get(gateway_id)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[gateway_id] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            gateway_data, etag = self._conditional_get(
+                self._base + "gateway/" + gateway_id, stale_etag)
+            if gateway_data is None:
+                # 304 Not Modified: the stale copy is still current
+                gateway_data = stale_value
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(gateway_data)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(gateway_id, None)
+
+        if self._cache_ttl > 0:
+            with self._cache_lock:
+                self._gateway_cache[gateway_id] = (time.monotonic(), etag,
+                                                   gateway_data)
+                self._gateway_cache.move_to_end(gateway_id)
+                while len(self._gateway_cache) > self._cache_max:
+                    self._gateway_cache.popitem(last=False)
+
+        return gateway_data
 
     def get_gateways_batch(self, gateway_ids: List[str]) -> List[JsonDict]:
         """
-        Récupère plusieurs passerelles par leurs IDs (via des appels GET successifs).
+        Récupère plusieurs passerelles par leurs IDs (via des appels GET concurrents).
 
         Args:
             gateway_ids (List[str]): Liste des IDs de passerelles à récupérer.
 
         Returns:
-            List[JsonDict]: Liste des données des passerelles.
+            List[JsonDict]: Liste des données des passerelles, dans l'ordre
+                            d'entrée.
         """
-        return [self.get_gateway(gid) for gid in gateway_ids]
+        ops = [{"method": "GET", "path": f"gateway/{gid}"}
+               for gid in gateway_ids]
+        results = self._batch_dispatch(ops)
+        if results is not None:
+            return self._raise_batch_errors(results)
+
+        with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
+            return list(executor.map(self.get_gateway, gateway_ids))
 
     def update_gateway(self, gateway_id: str, **kwargs: Any) -> JsonDict:
         """
@@ -327,6 +686,9 @@ class Lygos:
         if not kwargs:
             raise ValueError("Aucune donnée de mise à jour fournie. "
                              "Utilisez des arguments-clés pour spécifier les champs.")
+        # Invalidate any cached copy before it can be served stale
+        with self._cache_lock:
+            self._gateway_cache.pop(gateway_id, None)
         return self._request("PUT", f"gateway/{gateway_id}", json=kwargs)
 
     def update_gateways_batch(self, gateways_data: Dict[str, JsonDict]) -> List[JsonDict]:
@@ -341,12 +703,38 @@ class Lygos:
                 Ex: {"gw_123": {"amount": 1500}, "gw_456": {"message": "Test"}}
 
         Returns:
-            List[JsonDict]: Liste des passerelles mises à jour.
+            List[JsonDict]: Liste des passerelles mises à jour, dans l'ordre
+                            d'entrée.
         """
-        return [
-            self.update_gateway(gid, **data)
-            for gid, data in gateways_data.items()
-        ]
+        # Validate every item before touching cache or network, whatever
+        # the dispatch path, mirroring update_gateway
+        for gid, data in gateways_data.items():
+            if not data:
+                raise ValueError("Aucune donnée de mise à jour fournie pour "
+                                 f"'{gid}'.")
+
+        # Invalidate cached copies before dispatching, whatever the path,
+        # so a successful batch update can't leave stale entries behind
+        with self._cache_lock:
+            for gid in gateways_data:
+                self._gateway_cache.pop(gid, None)
+
+        ops = [{"method": "PUT", "path": f"gateway/{gid}", "body": data}
+               for gid, data in gateways_data.items()]
+        results = self._batch_dispatch(ops)
+        if results is not None:
+            return self._raise_batch_errors(results)
+
+        # Bodies are serialized upfront so the workers only do I/O
+        tasks = [(self._base + "gateway/" + gid, _dumps(data))
+                 for gid, data in gateways_data.items()]
+
+        def update_one(task: tuple) -> JsonDict:
+            url, body = task
+            return self._dispatch("PUT", url, data=body)
+
+        with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
+            return list(executor.map(update_one, tasks))
 
     def delete_gateway(self, gateway_id: str) -> None:
         """
@@ -359,12 +747,14 @@ class Lygos:
         Returns:
             None
         """
+        with self._cache_lock:
+            self._gateway_cache.pop(gateway_id, None)
         self._request("DELETE", f"gateway/{gateway_id}")
         return None
 
     def delete_gateways_batch(self, gateway_ids: List[str]) -> List[None]:
         """
-        Supprime plusieurs passerelles (via des appels DELETE successifs).
+        Supprime plusieurs passerelles (via des appels DELETE concurrents).
 
         Args:
             gateway_ids (List[str]): Liste des IDs de passerelles à supprimer.
@@ -373,7 +763,26 @@ class Lygos:
             List[None]: L'API renvoie 204 No Content, donc la liste
                         sera [None, None, ...].
         """
-        return [self.delete_gateway(gid) for gid in gateway_ids]
+        # Invalidate cached copies before dispatching, whatever the path,
+        # so a successful batch deletion can't leave stale entries behind
+        with self._cache_lock:
+            for gid in gateway_ids:
+                self._gateway_cache.pop(gid, None)
+
+        ops = [{"method": "DELETE", "path": f"gateway/{gid}"}
+               for gid in gateway_ids]
+        results = self._batch_dispatch(ops)
+        if results is not None:
+            return self._raise_batch_errors(results)
+
+        # Prebuild the URLs once so the workers only do I/O
+        urls = [self._base + "gateway/" + gid for gid in gateway_ids]
+
+        def delete_one(url: str) -> None:
+            return self._dispatch("DELETE", url)
+
+        with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
+            return list(executor.map(delete_one, urls))
 
     # --- Payin API Methods ---
 
@@ -389,3 +798,40 @@ class Lygos:
         """
         return self._request("GET", f"gateway/payin/{order_id}")
 
+
+
+def _make_field_getter(field: str):
+    """
+    Construit la méthode `get_<field>` pour un champ de passerelle.
+
+    Args:
+        field (str): Le nom du champ à exposer.
+
+    Returns:
+        function: Une méthode prenant un `gateway_id` et renvoyant
+                  {field: value}.
+    """
+    def getter(self, gateway_id: str) -> JsonDict:
+        gateway_data = self.get_gateway(gateway_id=gateway_id)
+        return {field: gateway_data.get(field)}
+
+    getter.__name__ = f"get_{field}"
+    getter.__qualname__ = f"Lygos.get_{field}"
+    getter.__doc__ = (
+        f"Récupère le champ '{field}' d'une passerelle.\n\n"
+        "        Args:\n"
+        "            gateway_id (str): L'ID de la passerelle à interroger.\n\n"
+        "        Returns:\n"
+        f"            JsonDict: Un dictionnaire contenant {{'{field}': value}}.\n"
+        "        "
+    )
+    return getter
+
+
+# Attach the get_<field> methods at import time so attribute access is a
+# plain (cached) class lookup instead of going through __getattr__; this
+# also restores dir(), autocomplete and inspect.signature for them.
+for _field in Lygos._SUPPORTED_GET_FIELDS:
+    setattr(Lygos, f"get_{_field}", _make_field_getter(_field))
+
+del _field
@@ -0,0 +1,50 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from lygospy import Lygos
+
+# Default transport answer: a plain 200 with an empty JSON body, built once
+_OK_RESPONSE = SimpleNamespace(status_code=200, content=b'{}',
+                               reason="OK", text="", headers={})
+
+
+@pytest.fixture(scope="session")
+def lygos_client():
+    """Shared Lygos client, built once for the whole test session."""
+    return Lygos(api_key="test_api_key")
+
+
+@pytest.fixture(autouse=True)
+def _reset_client_state(lygos_client):
+    """Clear per-client caches so tests stay independent despite the
+    session-scoped fixture."""
+    yield
+    lygos_client._gateway_cache.clear()
+    lygos_client._inflight.clear()
+
+
+@pytest.fixture(scope="module")
+def _request_patcher():
+    """Patch requests.Session.request once per module.
+
+    Starting/stopping the patcher per test re-wraps the attribute every
+    time; doing it once and resetting the mock between tests is much
+    cheaper.
+    """
+    patcher = patch('requests.Session.request')
+    mock = patcher.start()
+    yield mock
+    patcher.stop()
+
+
+@pytest.fixture
+def mock_request(_request_patcher):
+    """Per-test view of the shared transport mock, reset after each test.
+
+    The prebuilt 200/{} response is installed up front so tests only
+    touch the mock when they need a different answer.
+    """
+    _request_patcher.return_value = _OK_RESPONSE
+    yield _request_patcher
+    _request_patcher.reset_mock(return_value=True, side_effect=True)
@@ -1,6 +1,11 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import patch, MagicMock
-import requests.exceptions
 
 # Import from package root thanks to __init__.py
 from lygospy import Lygos
@@ -18,84 +23,119 @@ from lygospy.error_handler import (
     GatewayTimeoutError,
 )
 
-@pytest.fixture
-def lygos_client():
-    """Fixture for Lygos client."""
-    return Lygos(api_key="test_api_key")
+# URLs the client is expected to hit, built once instead of inline in each test
+BASE_URL = "https://api.lygosapp.com/v1/"
+GATEWAY_URL = BASE_URL + "gateway"
+BATCH_URL = BASE_URL + "batch"
+GW_123_URL = GATEWAY_URL + "/gw_123"
+GW_456_URL = GATEWAY_URL + "/gw_456"
+
+# Status-code-to-exception expectations, shared by the error tests
+ERROR_MAP = {
+    400: BadRequestError, 401: AuthenticationError, 403: PermissionDeniedError,
+    404: NotFoundError, 409: ConflictError, 422: UnprocessableEntityError,
+    500: ServerError, 502: BadGatewayError, 503: ServiceUnavailableError,
+    504: GatewayTimeoutError, 418: LygosAPIError # I'm a teapot
+}
+
+def _resp(status=200, content=b'{}', reason="OK", text=""):
+    """Build a lightweight response stub (much cheaper than MagicMock)."""
+    return SimpleNamespace(status_code=status, content=content,
+                           reason=reason, text=text, headers={})
+
+# Single 204 stub allocated at import; every No Content test reuses it
+NO_CONTENT = _resp(204, b'')
+
+def _make_err_response(status_code):
+    """Build a ready-to-serve error response stub for a status code."""
+    mock_response = MagicMock()
+    mock_response.status_code = status_code
+    mock_response.reason = "Test Error"
+    mock_response.text = "Test Error Body"
+    # A non-JSON body falls back to the raw text
+    mock_response.content = b"Test Error Body"
+    return mock_response
+
+# Built once at import so the error tests only do dict lookups
+ERROR_RESPONSES = {
+    status_code: (_make_err_response(status_code), exception_class)
+    for status_code, exception_class in ERROR_MAP.items()
+}
+
+def sent_json(call):
+    """Decode the serialized JSON body of a recorded request call."""
+    return json.loads(call[1]['data'])
+
+@pytest.fixture(scope="module")
+def ok_response():
+    """Prebuilt 200 response shared by the batch tests."""
+    return _resp(200, b'{"id": "gw_1", "amount": 100}')
+
+@pytest.fixture(scope="module")
+def bad_request_response():
+    """Prebuilt 400 response shared by the batch failure tests."""
+    return _resp(400, b"Bad Data", reason="Bad Data", text="Bad Data")
+
+@pytest.fixture(scope="module")
+def no_content_response():
+    """Prebuilt 204 response shared by the deletion tests."""
+    return NO_CONTENT
 
 def test_initialization(lygos_client):
     """Test that the Lygos client is initialized correctly."""
     assert lygos_client.api_key == "test_api_key"
-    assert lygos_client.base_url == "https://api.lygosapp.com/v1/"
+    assert lygos_client.base_url == BASE_URL
+    assert lygos_client.headers["api-key"] == "test_api_key"
     assert lygos_client.session.headers["api-key"] == "test_api_key"
     assert lygos_client.session.headers["User-Agent"] == "Lygos-Python-Client-v1"
+    # The reference headers are frozen; a write would corrupt every test
+    # sharing the session-scoped client
+    with pytest.raises(TypeError):
+        lygos_client.headers["api-key"] = "other"
 
 def test_initialization_no_api_key():
     """Test that ValueError is raised if no API key is provided."""
     with pytest.raises(ValueError, match="Une 'api_key' est requise"):
         Lygos(api_key="")
 
-@patch('requests.Session.request')
 def test_successful_request(mock_request, lygos_client):
     """Test a successful API request."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"status": "success"}
-    mock_request.return_value = mock_response
+    mock_request.return_value = _resp(200, b'{"status": "success"}')
 
     response = lygos_client._request("GET", "test_endpoint")
     assert response == {"status": "success"}
     mock_request.assert_called_once_with(
-        "GET", "https://api.lygosapp.com/v1/test_endpoint"
+        "GET", BASE_URL + "test_endpoint"
     )
 
-@patch('requests.Session.request')
 def test_successful_no_content_request(mock_request, lygos_client):
     """Test a successful 204 No Content request."""
-    mock_response = MagicMock()
-    mock_response.status_code = 204
-    mock_request.return_value = mock_response
+    mock_request.return_value = NO_CONTENT
 
     response = lygos_client._request("DELETE", "test_endpoint")
     assert response is None
     mock_request.assert_called_once_with(
-        "DELETE", "https://api.lygosapp.com/v1/test_endpoint"
+        "DELETE", BASE_URL + "test_endpoint"
     )
 
-@patch('requests.Session.request')
-def test_http_error_handling(mock_request, lygos_client):
+@pytest.mark.parametrize("status_code,exception_class", list(ERROR_MAP.items()))
+def test_http_error_handling(mock_request, lygos_client, status_code, exception_class):
     """Test that HTTP errors are correctly handled and mapped to custom exceptions."""
-    error_map = {
-        400: BadRequestError, 401: AuthenticationError, 403: PermissionDeniedError,
-        404: NotFoundError, 409: ConflictError, 422: UnprocessableEntityError,
-        500: ServerError, 502: BadGatewayError, 503: ServiceUnavailableError,
-        504: GatewayTimeoutError, 418: LygosAPIError # I'm a teapot
-    }
+    mock_response, _ = ERROR_RESPONSES[status_code]
+    mock_request.return_value = mock_response
+
+    with pytest.raises(exception_class) as exc_info:
+        lygos_client._request("GET", f"test_{status_code}")
+
+    assert exc_info.value.status_code == status_code
+    assert "Test Error Body" in str(exc_info.value)
 
-    for status_code, exception_class in error_map.items():
-        mock_response = MagicMock()
-        mock_response.status_code = status_code
-        mock_response.reason = "Test Error"
-        mock_response.text = "Test Error Body"
-        # Mock the JSONDecodeError
-        mock_response.json.side_effect = requests.JSONDecodeError("msg", "doc", 0)
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response)
-        mock_request.return_value = mock_response
-
-        with pytest.raises(exception_class) as exc_info:
-            lygos_client._request("GET", f"test_{status_code}")
-        
-        assert exc_info.value.status_code == status_code
-        assert "Test Error Body" in str(exc_info.value)
-
-@patch('requests.Session.request')
 def test_http_error_handling_with_json_message(mock_request, lygos_client):
     """Test that HTTP errors use the JSON message field if available."""
     mock_response = MagicMock()
     mock_response.status_code = 404
     mock_response.reason = "Not Found"
-    mock_response.json.return_value = {"message": "Resource not available", "details": "The ID was wrong"}
-    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response)
+    mock_response.content = b'{"message": "Resource not available", "details": "The ID was wrong"}'
     mock_request.return_value = mock_response
 
     with pytest.raises(NotFoundError) as exc_info:
@@ -104,33 +144,63 @@ def test_http_error_handling_with_json_message(mock_request, lygos_client):
     assert exc_info.value.status_code == 404
     assert "Resource not available: The ID was wrong" in str(exc_info.value)
 
-@patch('requests.Session.request')
 def test_list_gateways(mock_request, lygos_client):
     """Test listing all gateways."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = [{"id": "gw_1"}, {"id": "gw_2"}]
-    mock_request.return_value = mock_response
+    mock_request.return_value = _resp(200, b'[{"id": "gw_1"}, {"id": "gw_2"}]')
     
     result = lygos_client.list_gateways()
     assert result == [{"id": "gw_1"}, {"id": "gw_2"}]
     mock_request.assert_called_once_with(
-        "GET", "https://api.lygosapp.com/v1/gateway"
+        "GET", GATEWAY_URL
     )
 
-@patch('requests.Session.request')
+def test_iter_gateways(mock_request, lygos_client):
+    """Test streaming iteration over the gateway listing."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b'[{"id": "gw_1"}, {"id": "gw_2"}]'
+    mock_response.__enter__.return_value = mock_response
+    mock_request.return_value = mock_response
+
+    results = list(lygos_client.iter_gateways())
+    assert results == [{"id": "gw_1"}, {"id": "gw_2"}]
+    assert mock_request.call_args[0][0] == "GET"
+    assert mock_request.call_args[0][1] == GATEWAY_URL
+    assert mock_request.call_args[1]['stream'] is True
+
+def test_iter_gateways_streaming_with_ijson(mock_request, lygos_client, monkeypatch):
+    """Test the incremental ijson branch, including stream decompression."""
+    import lygospy.lygospy as lygos_module
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    # requests hands urllib3's stream over undecoded by default
+    mock_response.raw = SimpleNamespace(decode_content=False)
+    mock_response.__enter__.return_value = mock_response
+    mock_request.return_value = mock_response
+
+    def fake_items(stream, prefix):
+        # The stream must be switched to decoded mode before parsing,
+        # otherwise a gzip/deflate response would feed ijson raw bytes
+        assert stream.decode_content is True
+        assert prefix == "item"
+        yield from [{"id": "gw_1"}, {"id": "gw_2"}]
+
+    monkeypatch.setattr(lygos_module, "ijson", SimpleNamespace(items=fake_items))
+    assert list(lygos_client.iter_gateways()) == [{"id": "gw_1"}, {"id": "gw_2"}]
+
 def test_create_single_gateway(mock_request, lygos_client):
     """Test creating a single gateway."""
     gateway_data = {"amount": 100, "shop_name": "Test Shop"}
     lygos_client.create_gateway(**gateway_data)
     
     # We can't assert the full json because of the dynamic uuid
-    assert mock_request.call_args[1]['json']['amount'] == 100
-    assert mock_request.call_args[1]['json']['shop_name'] == "Test Shop"
-    assert "order_id" in mock_request.call_args[1]['json']
+    payload = sent_json(mock_request.call_args)
+    assert payload['amount'] == 100
+    assert payload['shop_name'] == "Test Shop"
+    assert "order_id" in payload
     assert mock_request.call_args[0][0] == "POST"
 
-@patch('requests.Session.request')
 def test_create_single_gateway_with_options(mock_request, lygos_client):
     """Test creating a single gateway with all optional fields."""
     gateway_data = {
@@ -143,10 +213,9 @@ def test_create_single_gateway_with_options(mock_request, lygos_client):
     }
     lygos_client.create_gateway(**gateway_data)
     
-    assert mock_request.call_args[1]['json'] == gateway_data
+    assert sent_json(mock_request.call_args) == gateway_data
     assert mock_request.call_args[0][0] == "POST"
 
-@patch('requests.Session.request')
 def test_create_gateways_batch(mock_request, lygos_client):
     """Test creating multiple gateways using create_gateways_batch."""
     gateways_data = [
@@ -155,25 +224,21 @@ def test_create_gateways_batch(mock_request, lygos_client):
     ]
     lygos_client.create_gateways_batch(gateways_data=gateways_data)
     assert mock_request.call_count == 2
-    assert mock_request.call_args_list[0][1]['json']['amount'] == 100
-    assert mock_request.call_args_list[1][1]['json']['amount'] == 200
+    # Requests are dispatched concurrently, so compare without ordering
+    amounts = {sent_json(call)['amount'] for call in mock_request.call_args_list}
+    assert amounts == {100, 200}
 
-@patch('requests.Session.request')
-def test_create_gateways_batch_with_failures(mock_request, lygos_client):
+def test_create_gateways_batch_with_failures(mock_request, lygos_client,
+                                             ok_response, bad_request_response):
     """Test that batch creation continues even if one request fails."""
-    mock_response_success = MagicMock()
-    mock_response_success.status_code = 200
-    mock_response_success.json.return_value = {"id": "gw_1", "amount": 100}
-    
-    mock_response_fail = MagicMock()
-    mock_response_fail.status_code = 400
-    mock_response_fail.reason = "Bad Data"
-    mock_response_fail.text = "Bad Data"
-    mock_response_fail.json.side_effect = requests.JSONDecodeError("msg", "doc", 0)
-    mock_response_fail.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response_fail)
-    
-    mock_request.side_effect = [mock_response_success, mock_response_fail]
-    
+    # Key responses on the payload since dispatch order is not deterministic
+    def respond(method, url, **kwargs):
+        if json.loads(kwargs['data'])['amount'] == 100:
+            return ok_response
+        return bad_request_response
+
+    mock_request.side_effect = respond
+
     gateways_data = [
         {"amount": 100, "shop_name": "Shop 1"},
         {"amount": 200, "shop_name": "Shop 2"}
@@ -186,39 +251,180 @@ def test_create_gateways_batch_with_failures(mock_request, lygos_client):
     assert "Bad Data" in results[1]["error"]
     assert results[1]["data"]["amount"] == 200
 
-@patch('requests.Session.request')
 def test_get_single_gateway(mock_request, lygos_client):
     """Test retrieving a single gateway."""
     lygos_client.get_gateway(gateway_id="gw_123")
     mock_request.assert_called_once_with(
-        "GET", "https://api.lygosapp.com/v1/gateway/gw_123"
+        "GET", GW_123_URL
     )
 
-@patch('requests.Session.request')
+def test_get_gateway_is_cached(mock_request, lygos_client):
+    """Test that repeated get_gateway calls are served from the TTL cache."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"id": "gw_123", "amount": 100}'
+    mock_request.return_value = mock_response
+
+    first = lygos_client.get_gateway(gateway_id="gw_123")
+    second = lygos_client.get_gateway(gateway_id="gw_123")
+    assert first == second
+    mock_request.assert_called_once()
+
+    # Updating the gateway invalidates its cache entry
+    lygos_client.update_gateway(gateway_id="gw_123", amount=200)
+    lygos_client.get_gateway(gateway_id="gw_123")
+    assert mock_request.call_count == 3
+
+def test_get_gateway_revalidates_with_etag(mock_request):
+    """Test that a stale cache entry is revalidated via If-None-Match."""
+    client = Lygos(api_key="test_api_key")
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"id": "gw_123"}'
+    mock_response.headers = {"ETag": '"abc123"'}
+    mock_request.return_value = mock_response
+
+    assert client.get_gateway("gw_123") == {"id": "gw_123"}
+
+    # Age the entry past the TTL, then have the server answer 304
+    timestamp, etag, value = client._gateway_cache["gw_123"]
+    client._gateway_cache["gw_123"] = (timestamp - 120, etag, value)
+    not_modified = MagicMock()
+    not_modified.status_code = 304
+    mock_request.return_value = not_modified
+
+    assert client.get_gateway("gw_123") == {"id": "gw_123"}
+    assert mock_request.call_args[1]['headers'] == {"If-None-Match": '"abc123"'}
+    # The refreshed entry serves the next call without any HTTP request
+    assert client.get_gateway("gw_123") == {"id": "gw_123"}
+    assert mock_request.call_count == 2
+
+def test_get_gateway_coalesces_concurrent_calls(mock_request, lygos_client):
+    """Test that concurrent get_gateway calls for one ID share a single GET."""
+    release = threading.Event()
+
+    def slow_response(method, url, **kwargs):
+        release.wait(timeout=5)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"id": "gw_123"}'
+        return mock_response
+
+    mock_request.side_effect = slow_response
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(lygos_client.get_gateway, "gw_123")
+        second = executor.submit(lygos_client.get_gateway, "gw_123")
+        # Let both threads reach the coalescer before the response arrives
+        time.sleep(0.05)
+        release.set()
+        assert first.result() == second.result() == {"id": "gw_123"}
+
+    mock_request.assert_called_once()
+
 def test_get_gateways_batch(mock_request, lygos_client):
     """Test retrieving multiple gateways using get_gateways_batch."""
     gateway_ids = ["gw_123", "gw_456"]
     lygos_client.get_gateways_batch(gateway_ids=gateway_ids)
     assert mock_request.call_count == 2
-    assert mock_request.call_args_list[0][0][0] == "GET"
-    assert mock_request.call_args_list[0][0][1] == "https://api.lygosapp.com/v1/gateway/gw_123"
-    assert mock_request.call_args_list[1][0][1] == "https://api.lygosapp.com/v1/gateway/gw_456"
+    assert all(call[0][0] == "GET" for call in mock_request.call_args_list)
+    urls = {call[0][1] for call in mock_request.call_args_list}
+    assert urls == {
+        GW_123_URL,
+        GW_456_URL,
+    }
+
+def test_get_gateways_batch_coalesced(mock_request):
+    """Test batch retrieval through the single coalesced batch endpoint."""
+    client = Lygos(api_key="test_api_key", server_supports_batch=True)
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({
+        "responses": [
+            {"status": 200, "body": {"id": "gw_123"}},
+            {"status": 200, "body": {"id": "gw_456"}},
+        ]
+    }).encode()
+    mock_request.return_value = mock_response
+
+    results = client.get_gateways_batch(gateway_ids=["gw_123", "gw_456"])
+    assert results == [{"id": "gw_123"}, {"id": "gw_456"}]
+    mock_request.assert_called_once()
+    assert mock_request.call_args[0][0] == "POST"
+    assert mock_request.call_args[0][1] == BATCH_URL
+    assert sent_json(mock_request.call_args) == {
+        "requests": [
+            {"method": "GET", "path": "gateway/gw_123"},
+            {"method": "GET", "path": "gateway/gw_456"},
+        ]
+    }
+
+def test_get_gateways_batch_coalesced_error(mock_request):
+    """Test that a failed entry in the batch envelope raises the mapped error."""
+    client = Lygos(api_key="test_api_key", server_supports_batch=True)
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({
+        "responses": [
+            {"status": 200, "body": {"id": "gw_123"}},
+            {"status": 404, "body": {"message": "Gateway not found"}},
+        ]
+    }).encode()
+    mock_request.return_value = mock_response
+
+    with pytest.raises(NotFoundError, match="Gateway not found"):
+        client.get_gateways_batch(gateway_ids=["gw_123", "gw_999"])
+
+def test_update_gateways_batch_coalesced_invalidates_cache(mock_request):
+    """Test that the coalesced batch update drops cached gateway entries."""
+    client = Lygos(api_key="test_api_key", server_supports_batch=True)
+    # Prime the cache through a plain GET
+    mock_request.return_value = _resp(200, b'{"id": "gw_123", "amount": 100}')
+    assert client.get_gateway("gw_123")["amount"] == 100
+
+    mock_request.return_value = _resp(200, json.dumps({
+        "responses": [{"status": 200, "body": {"id": "gw_123", "amount": 999}}]
+    }).encode())
+    client.update_gateways_batch({"gw_123": {"amount": 999}})
+
+    # The next read must hit the API again instead of the stale cache
+    mock_request.return_value = _resp(200, b'{"id": "gw_123", "amount": 999}')
+    assert client.get_gateway("gw_123")["amount"] == 999
 
-@patch('requests.Session.request')
 def test_update_single_gateway(mock_request, lygos_client):
     """Test updating a single gateway."""
     update_data = {"message": "Updated message"}
     lygos_client.update_gateway(gateway_id="gw_123", **update_data)
-    mock_request.assert_called_once_with(
-        "PUT", "https://api.lygosapp.com/v1/gateway/gw_123", json=update_data
-    )
+    mock_request.assert_called_once()
+    assert mock_request.call_args[0][0] == "PUT"
+    assert mock_request.call_args[0][1] == GW_123_URL
+    assert sent_json(mock_request.call_args) == update_data
 
 def test_update_single_gateway_no_data(lygos_client):
     """Test ValueError for missing update data in single gateway update."""
     with pytest.raises(ValueError, match="Aucune donnée de mise à jour"):
         lygos_client.update_gateway(gateway_id="gw_123")
 
-@patch('requests.Session.request')
+def test_empty_batches_make_no_requests(mock_request):
+    """Test that empty batch inputs return [] without any HTTP call."""
+    for supports_batch in (False, True):
+        client = Lygos(api_key="test_api_key",
+                       server_supports_batch=supports_batch)
+        assert client.create_gateways_batch([]) == []
+        assert client.get_gateways_batch([]) == []
+        assert client.update_gateways_batch({}) == []
+        assert client.delete_gateways_batch([]) == []
+    mock_request.assert_not_called()
+
+def test_update_gateways_batch_no_data(mock_request):
+    """Test ValueError for an empty update on every dispatch path."""
+    for supports_batch in (False, True):
+        client = Lygos(api_key="test_api_key",
+                       server_supports_batch=supports_batch)
+        with pytest.raises(ValueError, match="Aucune donnée de mise à jour"):
+            client.update_gateways_batch({"gw_123": {}})
+    mock_request.assert_not_called()
+
 def test_update_gateways_batch(mock_request, lygos_client):
     """Test updating multiple gateways using update_gateways_batch."""
     gateways_data = {
@@ -227,62 +433,60 @@ def test_update_gateways_batch(mock_request, lygos_client):
     }
     lygos_client.update_gateways_batch(gateways_data=gateways_data)
     assert mock_request.call_count == 2
-    assert mock_request.call_args_list[0][1]['json'] == {"message": "Hello"}
-    assert mock_request.call_args_list[1][1]['json'] == {"amount": 500}
+    payloads = [sent_json(call) for call in mock_request.call_args_list]
+    assert {"message": "Hello"} in payloads
+    assert {"amount": 500} in payloads
 
-@patch('requests.Session.request')
 def test_delete_gateway(mock_request, lygos_client):
     """Test deleting a single gateway."""
-    mock_response = MagicMock()
-    mock_response.status_code = 204
-    mock_request.return_value = mock_response
-    
+    mock_request.return_value = NO_CONTENT
+
     result = lygos_client.delete_gateway(gateway_id="gw_123")
     assert result is None
     mock_request.assert_called_once_with(
-        "DELETE", "https://api.lygosapp.com/v1/gateway/gw_123"
+        "DELETE", GW_123_URL
     )
 
-@patch('requests.Session.request')
-def test_delete_gateways_batch(mock_request, lygos_client):
+def test_delete_gateways_batch(mock_request, lygos_client, no_content_response):
     """Test deleting multiple gateways using delete_gateways_batch."""
-    mock_response = MagicMock()
-    mock_response.status_code = 204
-    mock_request.return_value = mock_response
+    mock_request.return_value = no_content_response
 
     gateway_ids = ["gw_123", "gw_456"]
     results = lygos_client.delete_gateways_batch(gateway_ids=gateway_ids)
     
     assert results == [None, None]
     assert mock_request.call_count == 2
-    assert mock_request.call_args_list[0][0][0] == "DELETE"
-    assert mock_request.call_args_list[0][0][1] == "https://api.lygosapp.com/v1/gateway/gw_123"
-    assert mock_request.call_args_list[1][0][1] == "https://api.lygosapp.com/v1/gateway/gw_456"
+    assert all(call[0][0] == "DELETE" for call in mock_request.call_args_list)
+    urls = {call[0][1] for call in mock_request.call_args_list}
+    assert urls == {
+        GW_123_URL,
+        GW_456_URL,
+    }
 
-@patch('requests.Session.request')
 def test_get_payin_status(mock_request, lygos_client):
     """Test getting payin status."""
     lygos_client.get_payin_status(order_id="order_123")
     mock_request.assert_called_once_with(
-        "GET", "https://api.lygosapp.com/v1/gateway/payin/order_123"
+        "GET", GATEWAY_URL + "/payin/order_123"
     )
 
+# Gateway payload served to the dynamic getter tests, one case per field
+GATEWAY_FIELD_VALUES = {
+    "link": "https://example.com",
+    "amount": 100,
+    "shop_name": "Test Shop",
+}
+
+@pytest.mark.parametrize("field,value", list(GATEWAY_FIELD_VALUES.items()))
 @patch.object(Lygos, 'get_gateway')
-def test_dynamic_get_methods(mock_get_gateway, lygos_client):
+def test_dynamic_get_methods(mock_get_gateway, lygos_client, field, value):
     """Test dynamic get_<field> methods."""
-    mock_get_gateway.return_value = {
-        "link": "https://example.com",
-        "amount": 100,
-        "shop_name": "Test Shop"
-    }
+    mock_get_gateway.return_value = GATEWAY_FIELD_VALUES
 
-    result = lygos_client.get_link(gateway_id="gw_123")
-    assert result == {"link": "https://example.com"}
+    result = getattr(lygos_client, f"get_{field}")(gateway_id="gw_123")
+    assert result == {field: value}
     mock_get_gateway.assert_called_with(gateway_id="gw_123")
 
-    result = lygos_client.get_amount(gateway_id="gw_123")
-    assert result == {"amount": 100}
-
 def test_dynamic_method_attribute_error(lygos_client):
     """Test that AttributeError is raised for unsupported dynamic methods."""
     with pytest.raises(AttributeError):
@@ -0,0 +1,38 @@
+import pytest
+import requests
+from unittest.mock import patch
+
+from lygospy.error_handler import BadGatewayError
+
+# These tests deliberately avoid the shared Session.request mock: they
+# cover what happens below that level, where urllib3 applies the retry
+# policy and the adapter hands the response back to the client.
+
+
+def test_default_retry_returns_final_error_response(lygos_client):
+    """Test that the default retry policy hands back the last response.
+
+    With raise_on_status=True urllib3 would raise MaxRetryError once the
+    retries are exhausted, short-circuiting the status-to-exception
+    mapping: every persistent 429/502/503/504 would surface as a bare
+    LygosAPIError without a status_code.
+    """
+    adapter = lygos_client.session.get_adapter(lygos_client.base_url)
+    retry = adapter.max_retries
+    assert retry.raise_on_status is False
+    assert set(retry.status_forcelist) == {429, 502, 503, 504}
+
+
+def test_persistent_502_maps_to_bad_gateway(lygos_client):
+    """Test that a 502 coming through the adapter maps to BadGatewayError."""
+    response = requests.Response()
+    response.status_code = 502
+    response.reason = "Bad Gateway"
+    response._content = b'{"message": "Serveur amont indisponible"}'
+
+    with patch.object(requests.adapters.HTTPAdapter, "send",
+                      return_value=response):
+        with pytest.raises(BadGatewayError) as exc_info:
+            lygos_client.list_gateways()
+
+    assert exc_info.value.status_code == 502